@@ -30,10 +30,22 @@ DEFAULT_SEPARATE_FILES = False  # Whether to create separate files for each loca
 DEFAULT_INCLUDE_LOCATION_IN_DATA = True  # Whether to add location column to data
 
 # API Configuration
+DEFAULT_PLACES_API = "legacy"  # "legacy" (Text Search + Details) or "new" (Places API v1)
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+MAX_RETRY_DELAY = 60  # seconds, upper bound for Retry-After and quota backoff
 PAGE_TOKEN_DELAY = 2  # seconds (required by Google)
-DELAY_BETWEEN_LOCATIONS = 1  # seconds between different location searches
+DEFAULT_LOCATION_WORKERS = 4  # locations searched concurrently
+DEFAULT_DETAIL_WORKERS = 8  # concurrent place details requests per page
+
+# Place Details cache
+CACHE_DIR = ".places_cache"
+CACHE_TTL = 7 * 24 * 60 * 60  # seconds before cached details are refetched
+
+# HTTP connection pooling
+POOL_CONNECTIONS = 4  # number of host pools to cache
+POOL_MAXSIZE = 32  # max connections kept alive per host
+ASYNC_MAX_CONCURRENCY = 16  # in-flight requests with --async
 
 # Validate API key
 if API_KEY == "YOUR_GOOGLE_MAPS_API_KEY" or not API_KEY:
@@ -1,9 +1,17 @@
 # google_places.py
 
+import diskcache
+import orjson
+import random
 import requests
+import threading
 import time
 import logging
-from config import API_KEY, MAX_RETRIES, RETRY_DELAY
+from requests.adapters import HTTPAdapter
+from config import (
+    API_KEY, MAX_RETRIES, RETRY_DELAY, MAX_RETRY_DELAY, POOL_CONNECTIONS, POOL_MAXSIZE,
+    CACHE_DIR, CACHE_TTL
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -13,45 +21,220 @@ class GooglePlacesError(Exception):
     """Custom exception for Google Places API errors"""
     pass
 
-def make_api_request(url, params, max_retries=MAX_RETRIES):
+class QuotaExceededError(GooglePlacesError):
+    """Raised when the API reports the quota or rate limit is exhausted"""
+    pass
+
+# Google APIs only gzip responses when the User-Agent also contains "gzip"
+HTTP_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "maps-doc-scraper/1.0 (gzip)"
+}
+
+def _create_adapter(pool_maxsize):
+    """
+    Keep-alive adapter; retries are handled by make_api_request, not by urllib3
+    """
+    return HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=0)
+
+# Shared session so TCP/TLS connections to maps.googleapis.com are reused
+# across calls
+_session = requests.Session()
+_session.mount("https://", _create_adapter(POOL_MAXSIZE))
+_session.headers.update(HTTP_HEADERS)
+
+# Persistent Place Details cache shared across runs, opened on first use so
+# --help and --no-cache never create CACHE_DIR
+_cache = None
+_cache_lock = threading.Lock()
+_cache_enabled = True
+_cache_ttl = CACHE_TTL
+
+TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+DETAILS_FIELDS = "name,formatted_address,formatted_phone_number,website,types,rating,user_ratings_total,opening_hours,price_level"
+
+# Places API (New) Text Search
+PLACES_V1_SEARCH_URL = "https://places.googleapis.com/v1/places:searchText"
+PLACES_V1_FIELD_MASK = ",".join([
+    "places.id",
+    "places.displayName",
+    "places.formattedAddress",
+    "places.nationalPhoneNumber",
+    "places.websiteUri",
+    "places.types",
+    "places.rating",
+    "places.userRatingCount",
+    "places.priceLevel",
+    "places.regularOpeningHours",
+    "nextPageToken",
+])
+PLACES_V1_PRICE_LEVELS = {
+    "PRICE_LEVEL_FREE": 0,
+    "PRICE_LEVEL_INEXPENSIVE": 1,
+    "PRICE_LEVEL_MODERATE": 2,
+    "PRICE_LEVEL_EXPENSIVE": 3,
+    "PRICE_LEVEL_VERY_EXPENSIVE": 4,
+}
+
+def size_session_pool(max_concurrent_requests):
+    """
+    Grow the shared session's connection pool to fit the number of requests
+    that can be in flight at once
+
+    Connections beyond pool_maxsize are opened per request and discarded,
+    paying a fresh TLS handshake each time.
+    """
+    pool_maxsize = max(POOL_MAXSIZE, max_concurrent_requests)
+    if pool_maxsize != _session.get_adapter("https://").poolmanager.connection_pool_kw.get("maxsize"):
+        _session.mount("https://", _create_adapter(pool_maxsize))
+
+def close_session():
+    """
+    Close the shared HTTP session and release pooled connections
+    """
+    _session.close()
+
+def configure_cache(enabled=True, ttl=CACHE_TTL):
+    """
+    Enable or bypass the Place Details cache and set how long entries live
+    """
+    global _cache_enabled, _cache_ttl
+    _cache_enabled = enabled
+    _cache_ttl = ttl
+    if enabled:
+        _get_cache()
+    else:
+        close_cache()
+
+def _get_cache():
+    """
+    Return the Place Details cache, opening it if needed, or None when disabled
+    """
+    global _cache
+    if not _cache_enabled:
+        return None
+    if _cache is not None:
+        return _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(CACHE_DIR)
+        return _cache
+
+def close_cache():
+    """
+    Close the on-disk Place Details cache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+def check_api_status(data):
+    """
+    Raise GooglePlacesError for a legacy Places API response that is not OK
+    """
+    if data.get("status") in ["OK", "ZERO_RESULTS"]:
+        return
+    
+    error_msg = data.get("error_message", f"API returned status: {data.get('status')}")
+    if data.get("status") == "OVER_QUERY_LIMIT":
+        raise QuotaExceededError(f"API quota exceeded: {error_msg}")
+    elif data.get("status") == "REQUEST_DENIED":
+        raise GooglePlacesError(f"Request denied - check API key and permissions: {error_msg}")
+    else:
+        raise GooglePlacesError(f"API error: {error_msg}")
+
+def raise_places_v1_error(status_code, data):
+    """
+    Raise GooglePlacesError from a Places API (New) error response body
+    """
+    error = data.get("error", {})
+    error_msg = error.get("message", f"HTTP {status_code}")
+    if error.get("status") == "RESOURCE_EXHAUSTED":
+        raise QuotaExceededError(f"API quota exceeded: {error_msg}")
+    elif error.get("status") in ["PERMISSION_DENIED", "UNAUTHENTICATED"]:
+        raise GooglePlacesError(f"Request denied - check API key and permissions: {error_msg}")
+    else:
+        raise GooglePlacesError(f"API error: {error_msg}")
+
+def parse_retry_after(response):
+    """
+    Return the Retry-After delay of a response in seconds, or None
+
+    Only the delta-seconds form is supported; the value is capped at
+    MAX_RETRY_DELAY.
+    """
+    if response is None:
+        return None
+    try:
+        return min(MAX_RETRY_DELAY, max(0.0, float(response.headers.get("Retry-After"))))
+    except (TypeError, ValueError):
+        return None
+
+def quota_backoff_delay(attempt):
+    """
+    Exponential backoff with jitter for quota and rate limit errors
+    """
+    return min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** attempt + random.random())
+
+def make_api_request(url, params=None, max_retries=MAX_RETRIES, json_body=None, headers=None):
     """
     Make API request with retry logic and error handling
+
+    Requests with a json_body are POSTed to the Places API (New), which
+    reports errors through the HTTP status instead of a "status" field.
     """
     for attempt in range(max_retries):
+        response = None
         try:
-            response = requests.get(url, params=params, timeout=10)
+            if json_body is None:
+                response = _session.get(url, params=params, headers=headers, timeout=10)
+            else:
+                response = _session.post(url, json=json_body, headers=headers, timeout=10)
+                if 400 <= response.status_code < 500:
+                    try:
+                        error_data = orjson.loads(response.content)
+                    except ValueError:
+                        error_data = {}
+                    raise_places_v1_error(response.status_code, error_data)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Check for Google API specific errors
-            if data.get("status") not in ["OK", "ZERO_RESULTS"]:
-                error_msg = data.get("error_message", f"API returned status: {data.get('status')}")
-                if data.get("status") == "OVER_QUERY_LIMIT":
-                    raise GooglePlacesError(f"API quota exceeded: {error_msg}")
-                elif data.get("status") == "REQUEST_DENIED":
-                    raise GooglePlacesError(f"Request denied - check API key and permissions: {error_msg}")
-                else:
-                    raise GooglePlacesError(f"API error: {error_msg}")
+            if json_body is None:
+                check_api_status(data)
             
             return data
             
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
+        except QuotaExceededError as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = parse_retry_after(response) or quota_backoff_delay(attempt)
+            logger.warning("%s (attempt %s/%s), retrying in %.1fs", e, attempt + 1, max_retries, delay)
+            time.sleep(delay)
+        
+        except GooglePlacesError:
+            # REQUEST_DENIED and invalid requests will not succeed on retry
+            raise
+        
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.warning("Request failed (attempt %s/%s): %s", attempt + 1, max_retries, e)
             if attempt < max_retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
+                time.sleep(parse_retry_after(response) or RETRY_DELAY * (attempt + 1))
             else:
                 raise GooglePlacesError(f"Failed to make API request after {max_retries} attempts: {e}")
         
         except Exception as e:
-            logger.error(f"Unexpected error during API request: {e}")
+            logger.error("Unexpected error during API request: %s", e)
             raise GooglePlacesError(f"Unexpected error: {e}")
 
 def search_places(query, next_page_token=None):
     """
     Search for places using Google Places Text Search API
     """
-    url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
     params = {
         "query": query,
         "key": API_KEY
@@ -59,23 +242,107 @@ def search_places(query, next_page_token=None):
     if next_page_token:
         params["pagetoken"] = next_page_token
 
-    logger.info(f"Searching for: {query}")
-    return make_api_request(url, params)
+    logger.info("Searching for: %s", query)
+    return make_api_request(TEXT_SEARCH_URL, params)
+
+def get_cached_details(place_id):
+    """
+    Return cached Place Details for place_id, or None on a cache miss
+
+    The requested fields are part of the cache key so changing them
+    invalidates stale entries.
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    details = cache.get(("details", place_id, DETAILS_FIELDS))
+    if details is not None:
+        logger.debug("Cache hit for place_id %s", place_id)
+    return details
+
+def cache_details(place_id, details):
+    """
+    Store Place Details for the cache TTL; empty (failed) lookups are skipped
+    """
+    cache = _get_cache()
+    if details and cache is not None:
+        cache.set(("details", place_id, DETAILS_FIELDS), details, expire=_cache_ttl)
 
 def get_place_details(place_id):
     """
-    Get detailed information for a specific place
+    Get detailed information for a specific place, using the on-disk cache
     """
-    url = "https://maps.googleapis.com/maps/api/place/details/json"
+    details = get_cached_details(place_id)
+    if details is not None:
+        return details
+    
     params = {
         "place_id": place_id,
-        "fields": "name,formatted_address,formatted_phone_number,website,types,rating,user_ratings_total,opening_hours,price_level",
+        "fields": DETAILS_FIELDS,
         "key": API_KEY
     }
     
     try:
-        response = make_api_request(url, params)
-        return response.get("result", {})
+        response = make_api_request(DETAILS_URL, params)
+        details = response.get("result", {})
     except GooglePlacesError as e:
-        logger.error(f"Failed to get details for place_id {place_id}: {e}")
+        logger.error("Failed to get details for place_id %s: %s", place_id, e)
         return {}
+    
+    cache_details(place_id, details)
+    return details
+
+def v1_place_to_details(place):
+    """
+    Convert a Places API (New) place into the legacy Place Details shape
+    """
+    get = place.get
+    details = {
+        "place_id": get("id"),
+        "name": get("displayName", {}).get("text"),
+        "formatted_address": get("formattedAddress"),
+        "formatted_phone_number": get("nationalPhoneNumber"),
+        "website": get("websiteUri"),
+        "types": get("types"),
+        "rating": get("rating"),
+        "user_ratings_total": get("userRatingCount"),
+        "price_level": PLACES_V1_PRICE_LEVELS.get(get("priceLevel")),
+        "opening_hours": get("regularOpeningHours"),
+    }
+    # Drop missing fields so callers fall back to their defaults
+    return {key: value for key, value in details.items() if value is not None}
+
+def build_v1_search_request(query, next_page_token=None):
+    """
+    Build the headers and JSON body for a Places API (New) Text Search
+    """
+    headers = {
+        "X-Goog-Api-Key": API_KEY,
+        "X-Goog-FieldMask": PLACES_V1_FIELD_MASK
+    }
+    body = {"textQuery": query}
+    if next_page_token:
+        body["pageToken"] = next_page_token
+    return headers, body
+
+def parse_v1_search_response(data):
+    """
+    Convert a Places API (New) Text Search response to the legacy search shape
+    """
+    return {
+        "results": [v1_place_to_details(place) for place in data.get("places", [])],
+        "next_page_token": data.get("nextPageToken")
+    }
+
+def search_places_v1(query, next_page_token=None):
+    """
+    Search for places using Places API (New) Text Search
+
+    A single field-masked request returns every field the legacy flow needed
+    a separate Place Details call for. Results are converted to the legacy
+    Place Details shape so they can be validated the same way.
+    """
+    headers, body = build_v1_search_request(query, next_page_token)
+    logger.info("Searching for: %s", query)
+    data = make_api_request(PLACES_V1_SEARCH_URL, json_body=body, headers=headers)
+    return parse_v1_search_response(data)
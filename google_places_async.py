@@ -0,0 +1,132 @@
+# google_places_async.py
+
+import asyncio
+import logging
+import httpx
+import orjson
+from config import API_KEY, MAX_RETRIES, RETRY_DELAY, POOL_MAXSIZE, ASYNC_MAX_CONCURRENCY
+from google_places import (
+    GooglePlacesError, QuotaExceededError, HTTP_HEADERS, TEXT_SEARCH_URL, DETAILS_URL, DETAILS_FIELDS,
+    PLACES_V1_SEARCH_URL,
+    check_api_status, raise_places_v1_error, parse_retry_after, quota_backoff_delay,
+    get_cached_details, cache_details, build_v1_search_request, parse_v1_search_response
+)
+
+logger = logging.getLogger(__name__)
+
+# httpx logs every request URL at INFO, and legacy requests carry the API key
+# as a query parameter; also keeps per-request lines off the progress bar
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+class PlacesClient(httpx.AsyncClient):
+    """
+    httpx client that allows at most max_concurrency requests in flight
+
+    HTTP/2 multiplexes requests over a few connections, so the connection
+    pool limit alone does not bound them.
+    """
+    def __init__(self, max_concurrency, **kwargs):
+        super().__init__(**kwargs)
+        self.request_slots = asyncio.Semaphore(max_concurrency)
+
+def create_client(max_concurrency=ASYNC_MAX_CONCURRENCY):
+    """
+    Create an HTTP/2 client with a keep-alive connection pool, allowing at
+    most max_concurrency requests in flight
+    """
+    limits = httpx.Limits(max_connections=max(POOL_MAXSIZE, max_concurrency),
+                          max_keepalive_connections=max_concurrency)
+    return PlacesClient(max_concurrency, http2=True, limits=limits, headers=HTTP_HEADERS, timeout=10.0)
+
+async def make_api_request(client, url, params=None, max_retries=MAX_RETRIES, json_body=None, headers=None):
+    """
+    Make API request with retry logic and error handling
+    """
+    for attempt in range(max_retries):
+        response = None
+        try:
+            async with client.request_slots:
+                if json_body is None:
+                    response = await client.get(url, params=params, headers=headers)
+                else:
+                    response = await client.post(url, json=json_body, headers=headers)
+
+            if json_body is not None and 400 <= response.status_code < 500:
+                try:
+                    error_data = orjson.loads(response.content)
+                except ValueError:
+                    error_data = {}
+                raise_places_v1_error(response.status_code, error_data)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+
+            # Check for Google API specific errors
+            if json_body is None:
+                check_api_status(data)
+
+            return data
+
+        except QuotaExceededError as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = parse_retry_after(response) or quota_backoff_delay(attempt)
+            logger.warning("%s (attempt %s/%s), retrying in %.1fs", e, attempt + 1, max_retries, delay)
+            await asyncio.sleep(delay)
+
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.warning("Request failed (attempt %s/%s): %s", attempt + 1, max_retries, e)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(parse_retry_after(response) or RETRY_DELAY * (attempt + 1))
+            else:
+                raise GooglePlacesError(f"Failed to make API request after {max_retries} attempts: {e}")
+
+async def search_places(client, query, next_page_token=None):
+    """
+    Search for places using Google Places Text Search API
+    """
+    params = {
+        "query": query,
+        "key": API_KEY
+    }
+    if next_page_token:
+        params["pagetoken"] = next_page_token
+
+    logger.info("Searching for: %s", query)
+    return await make_api_request(client, TEXT_SEARCH_URL, params)
+
+async def get_place_details(client, place_id):
+    """
+    Get detailed information for a specific place, using the on-disk cache
+
+    Cache reads and writes are SQLite calls, so they run in a worker thread
+    to keep the event loop free.
+    """
+    details = await asyncio.to_thread(get_cached_details, place_id)
+    if details is not None:
+        return details
+
+    params = {
+        "place_id": place_id,
+        "fields": DETAILS_FIELDS,
+        "key": API_KEY
+    }
+
+    try:
+        response = await make_api_request(client, DETAILS_URL, params)
+        details = response.get("result", {})
+    except GooglePlacesError as e:
+        logger.error("Failed to get details for place_id %s: %s", place_id, e)
+        return {}
+
+    await asyncio.to_thread(cache_details, place_id, details)
+    return details
+
+async def search_places_v1(client, query, next_page_token=None):
+    """
+    Search for places using Places API (New) Text Search
+    """
+    headers, body = build_v1_search_request(query, next_page_token)
+    logger.info("Searching for: %s", query)
+    data = await make_api_request(client, PLACES_V1_SEARCH_URL, json_body=body, headers=headers)
+    return parse_v1_search_response(data)
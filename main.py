@@ -7,19 +7,30 @@ Supports different specialties across multiple locations simultaneously.
 """
 
 import argparse
+import asyncio
 import time
 import csv
 import logging
 import sys
 import os
+import re
+import threading
+from collections import Counter, deque
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from tqdm import tqdm
 from config import (
     DEFAULT_SPECIALTY, DEFAULT_PLACES, DEFAULT_OUTPUT_FILE, 
-    PAGE_TOKEN_DELAY, DELAY_BETWEEN_LOCATIONS,
-    DEFAULT_SEPARATE_FILES, DEFAULT_INCLUDE_LOCATION_IN_DATA
+    PAGE_TOKEN_DELAY, DEFAULT_SEPARATE_FILES, DEFAULT_INCLUDE_LOCATION_IN_DATA,
+    DEFAULT_DETAIL_WORKERS, DEFAULT_LOCATION_WORKERS, DEFAULT_PLACES_API, CACHE_TTL,
+    ASYNC_MAX_CONCURRENCY
+)
+import google_places_async
+from google_places import (
+    search_places, search_places_v1, get_place_details, size_session_pool, close_session,
+    configure_cache, close_cache, GooglePlacesError
 )
-from google_places import search_places, get_place_details, GooglePlacesError
 
 # Set up logging
 logging.basicConfig(
@@ -32,17 +43,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CSV columns in output order; search_location is appended when enabled
+FIELDNAMES = (
+    "name", "address", "phone", "website", "tags", "rating",
+    "total_ratings", "price_level", "opening_hours", "scraped_at"
+)
+LOCATION_FIELD = "search_location"
+
+# Max rows handed to one disk write by the async row writer
+ROW_BATCH_SIZE = 64
+
+# CSV write buffer; rows are only flushed when it fills or the file closes
+CSV_BUFFER_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _normalize(text):
+    """
+    Lowercase and collapse whitespace so equivalent strings compare equal
+    """
+    return _WHITESPACE.sub(" ", text.strip().lower()) if text else ""
+
+def _listing_key(row):
+    """
+    Key identifying the same business listed under more than one place_id
+    """
+    return (_normalize(row["name"]), _normalize(row["address"]))
+
 class MultiLocationHealthcareFinder:
     def __init__(self, specialty, places, output_file, max_results_per_location=None, 
-                 separate_files=False, include_location_in_data=True):
+                 separate_files=False, include_location_in_data=True,
+                 detail_workers=DEFAULT_DETAIL_WORKERS,
+                 location_workers=DEFAULT_LOCATION_WORKERS, places_api=DEFAULT_PLACES_API,
+                 async_concurrency=ASYNC_MAX_CONCURRENCY):
         self.specialty = specialty
         self.places = places if isinstance(places, list) else [places]
         self.output_file = output_file
         self.max_results_per_location = max_results_per_location
         self.separate_files = separate_files
         self.include_location_in_data = include_location_in_data
-        self.all_results = []
-        self.results_by_location = {}
+        self.detail_workers = detail_workers
+        self.location_workers = location_workers
+        self.places_api = places_api
+        self.async_concurrency = async_concurrency
+        self.total_found = 0
+        self.location_counts = Counter()
+        self.quality_counts = Counter()
+        self._stop_event = threading.Event()
+        self._output_lock = threading.Lock()
+        self._output_files = {}
+        self._rows_written = {}
+        self._pbar = None
+        self._row_queue = None
+        self._fieldnames = FIELDNAMES + (LOCATION_FIELD,) if include_location_in_data else FIELDNAMES
+        self._row_values = itemgetter(*self._fieldnames)
+        self._details_lock = threading.Lock()
+        self._details_events = {}
+        self._details_by_place_id = {}
+        self._details_tasks = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Flush whatever was streamed so far, even if the run failed
+        self._close_output_files()
+        self._stop_progress()
+        return False
         
     def create_search_query(self, specialty, place):
         """
@@ -50,215 +117,562 @@ class MultiLocationHealthcareFinder:
         """
         return f"{specialty} in {place}"
         
-    def validate_place_data(self, details, location=None):
+    def _get_place_details_once(self, place_id):
+        """
+        Fetch details for a place at most once per run, sharing the result
+        with every location whose search returned the same place
+        """
+        with self._details_lock:
+            done = self._details_events.get(place_id)
+            is_owner = done is None
+            if is_owner:
+                done = self._details_events[place_id] = threading.Event()
+        
+        if is_owner:
+            try:
+                self._details_by_place_id[place_id] = get_place_details(place_id)
+            finally:
+                done.set()
+        else:
+            logger.debug("Reusing details for duplicate place_id %s", place_id)
+        
+        done.wait()
+        return self._details_by_place_id.get(place_id, {})
+        
+    def validate_place_data(self, details, location=None, scraped_at=None):
         """
         Validate and clean place data
+
+        scraped_at is shared by every place of a results page; it defaults
+        to the current time.
         """
+        # Bound once: cheaper than a method lookup per field
+        get = details.get
+        
+        # Basic validation, before building the row
+        name = get("name", "N/A")
+        if name == "N/A":
+            logger.warning("Place found with no name - skipping")
+            return None
+        
         validated_data = {
-            "name": details.get("name", "N/A"),
-            "address": details.get("formatted_address", "N/A"),
-            "phone": details.get("formatted_phone_number", "N/A"),
-            "website": details.get("website", "N/A"),
-            "tags": ", ".join(details.get("types", [])),
-            "rating": details.get("rating", "N/A"),
-            "total_ratings": details.get("user_ratings_total", "N/A"),
-            "price_level": details.get("price_level", "N/A"),
-            "opening_hours": "Available" if details.get("opening_hours") else "N/A",
-            "scraped_at": datetime.now().isoformat()
+            "name": name,
+            "address": get("formatted_address", "N/A"),
+            "phone": get("formatted_phone_number", "N/A"),
+            "website": get("website", "N/A"),
+            "tags": ", ".join(get("types", ())),
+            "rating": get("rating", "N/A"),
+            "total_ratings": get("user_ratings_total", "N/A"),
+            "price_level": get("price_level", "N/A"),
+            "opening_hours": "Available" if get("opening_hours") else "N/A",
+            "scraped_at": scraped_at or datetime.now().isoformat()
         }
         
         # Add location information if requested
         if self.include_location_in_data and location:
-            validated_data["search_location"] = location
-        
-        # Basic validation
-        if validated_data["name"] == "N/A":
-            logger.warning("Place found with no name - skipping")
-            return None
+            validated_data[LOCATION_FIELD] = location
             
         return validated_data
     
+    def _is_new_listing(self, seen_listings, row):
+        """
+        Record a row's listing key, returning False if the location already has it
+        """
+        key = _listing_key(row)
+        if key in seen_listings:
+            logger.debug("Skipping duplicate listing: %s", row["name"])
+            return False
+        seen_listings.add(key)
+        return True
+    
+    def _new_places(self, seen_place_ids, places):
+        """
+        Drop places already returned for this location, which Google can
+        repeat on adjacent pages, and results without a place_id, before any
+        details are fetched for them
+        """
+        new_places = []
+        for place in places:
+            place_id = place.get("place_id")
+            if place_id is None:
+                logger.warning("Search result %s has no place_id - skipping", place.get("name", "Unknown"))
+                continue
+            if place_id in seen_place_ids:
+                logger.debug("Skipping duplicate place_id %s", place_id)
+                continue
+            seen_place_ids.add(place_id)
+            new_places.append(place)
+        return new_places
+    
+    def _prefetches_next_page(self, found, places, page_token):
+        """
+        Whether to request the next page while this one is still processed
+
+        Skipped when this page can already reach max_results_per_location,
+        so a capped run never pays for a page it will not use.
+        """
+        if not page_token:
+            return False
+        return not self.max_results_per_location or found + len(places) < self.max_results_per_location
+    
+    def _search_page(self, search_query, page_token=None, not_before=0.0):
+        """
+        Fetch one page of search results, waiting until not_before (a
+        time.monotonic() value) for the page token to become valid
+
+        Returns None if the search is stopped while waiting.
+        """
+        delay = not_before - time.monotonic()
+        if delay > 0:
+            logger.debug("Waiting %.1fs for the next page of '%s'...", delay, search_query)
+            if self._stop_event.wait(delay):
+                return None
+        
+        if self.places_api == "new":
+            return search_places_v1(search_query, next_page_token=page_token)
+        return search_places(search_query, next_page_token=page_token)
+    
     def fetch_providers_for_location(self, location):
         """
         Fetch healthcare providers for a specific location
         """
         search_query = self.create_search_query(self.specialty, location)
-        logger.info(f"Searching for: {search_query}")
+        logger.info("Searching for: %s", search_query)
+        
+        found = 0
+        # No limit compares as infinity, so the per-place check is one comparison
+        max_results = self.max_results_per_location or float("inf")
+        seen_listings = set()
+        seen_place_ids = set()
+        page_token = None
+        token_issued_at = 0.0
+        next_page = None
+        page_count = 0
+        
+        # Bound once for the per-place loop
+        stopped = self._stop_event.is_set
+        get_details = self._get_place_details_once
+        validate = self.validate_place_data
+        is_new_listing = self._is_new_listing
+        write_row = self._write_row
+        
+        try:
+            # One background search per location fetches the next page while
+            # details for the current one are processed
+            with ThreadPoolExecutor(max_workers=1) as page_fetcher:
+                while not stopped():
+                    page_count += 1
+                    logger.info("Fetching page %s for %s...", page_count, location)
+                    
+                    # Search for places; the next_page_token becomes valid
+                    # PAGE_TOKEN_DELAY after it is issued
+                    if next_page is None:
+                        data = self._search_page(search_query, page_token, token_issued_at + PAGE_TOKEN_DELAY)
+                    else:
+                        data, next_page = next_page.result(), None
+                    if data is None:
+                        break
+                    token_issued_at = time.monotonic()
+                    scraped_at = datetime.now().isoformat()
+                    places = data.get("results", [])
+                    
+                    if not places:
+                        logger.info("No more results found for %s", location)
+                        break
+                    
+                    places = self._new_places(seen_place_ids, places)
+                    page_token = data.get("next_page_token")
+                    if self._prefetches_next_page(found, places, page_token):
+                        next_page = page_fetcher.submit(self._search_page, search_query, page_token,
+                                                        token_issued_at + PAGE_TOKEN_DELAY)
+                    
+                    # Fetch details concurrently but consume them in search ranking order.
+                    # Only as many places as rows still wanted are in flight, topped up
+                    # as places are rejected, so the cap also bounds billed Details calls.
+                    with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+                        pending = deque()
+                        unsubmitted = iter(places)
+                        while True:
+                            while len(pending) < max_results - found:
+                                place = next(unsubmitted, None)
+                                if place is None:
+                                    break
+                                if self.places_api == "new":
+                                    # Text Search (New) results already carry every field we need
+                                    pending.append((place, None))
+                                else:
+                                    pending.append((place, executor.submit(get_details, place["place_id"])))
+                            if not pending:
+                                break
+                            if stopped():
+                                # Don't let the executor wait out queued requests on shutdown
+                                for _, queued in pending:
+                                    if queued:
+                                        queued.cancel()
+                                break
+                            
+                            place, future = pending.popleft()
+                            try:
+                                details = future.result() if future else place
+                                validated_data = validate(details, location, scraped_at)
+                                
+                                if validated_data and is_new_listing(seen_listings, validated_data):
+                                    write_row(location, validated_data)
+                                    found += 1
+                                
+                            except Exception as e:
+                                logger.error("Error processing place %s: %s", place.get("name", "Unknown"), e)
+                    
+                    # Check for next page, without searching again once the cap is met
+                    if found >= max_results:
+                        logger.info("Reached max results limit for %s: %s", location, max_results)
+                        break
+                    if not page_token:
+                        break
+                    
+        except GooglePlacesError as e:
+            logger.error("Google Places API error for %s: %s", location, e)
+            if not found:
+                raise
+        except KeyboardInterrupt:
+            logger.info("Search interrupted by user for %s", location)
+        except Exception as e:
+            logger.error("Unexpected error during search for %s: %s", location, e)
+            if not found:
+                raise
+        
+        logger.info("Completed search for %s. Found %s providers", location, found)
+        return found
+    
+    def fetch_all_providers(self):
+        """
+        Fetch healthcare providers for all locations
+        """
+        logger.info("Starting multi-location search for %s", self.specialty)
+        logger.info("Locations: %s", ", ".join(self.places))
+        
+        # Search locations concurrently; per-page token delays of different
+        # locations overlap and all workers share the pooled HTTP session.
+        # Each location has its details workers plus one next-page search in flight.
+        max_workers = max(1, min(len(self.places), self.location_workers))
+        size_session_pool(max_workers * (self.detail_workers + 1))
+        self._start_progress()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.fetch_providers_for_location, location): location
+                           for location in self.places}
+                try:
+                    for future in as_completed(futures):
+                        location = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.error("Failed to process %s: %s", location, e)
+                except KeyboardInterrupt:
+                    # Running locations stop at their next place or page
+                    self._stop_event.set()
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            # Rows are streamed as they are found, so close the files even when
+            # interrupted to keep the partial output
+            self._close_output_files()
+            self._stop_progress()
+        
+        return self._finish_search()
+    
+    async def _get_place_details_once_async(self, client, place_id):
+        """
+        Async counterpart of _get_place_details_once; concurrent lookups of the
+        same place await a single shared task
+        """
+        task = self._details_tasks.get(place_id)
+        if task is None:
+            task = asyncio.ensure_future(google_places_async.get_place_details(client, place_id))
+            self._details_tasks[place_id] = task
+        else:
+            logger.debug("Reusing details for duplicate place_id %s", place_id)
+        return await task
+    
+    async def _search_page_async(self, client, search_query, page_token=None, not_before=0.0):
+        """
+        Async counterpart of _search_page
+        """
+        delay = not_before - time.monotonic()
+        if delay > 0:
+            logger.debug("Waiting %.1fs for the next page of '%s'...", delay, search_query)
+            await asyncio.sleep(delay)
+        
+        if self.places_api == "new":
+            return await google_places_async.search_places_v1(client, search_query, next_page_token=page_token)
+        return await google_places_async.search_places(client, search_query, next_page_token=page_token)
+    
+    async def fetch_providers_for_location_async(self, client, location):
+        """
+        Fetch healthcare providers for a specific location without blocking
+        the event loop
+        """
+        search_query = self.create_search_query(self.specialty, location)
+        logger.info("Searching for: %s", search_query)
         
-        location_results = []
+        found = 0
+        # No limit compares as infinity, so the per-place check is one comparison
+        max_results = self.max_results_per_location or float("inf")
+        seen_listings = set()
+        seen_place_ids = set()
         page_token = None
+        token_issued_at = 0.0
+        next_page = None
         page_count = 0
         
+        # Bound once for the per-place loop
+        validate = self.validate_place_data
+        is_new_listing = self._is_new_listing
+        queue_row = self._row_queue.put_nowait
+        
         try:
             while True:
                 page_count += 1
-                logger.info(f"Fetching page {page_count} for {location}...")
+                logger.info("Fetching page %s for %s...", page_count, location)
                 
-                # Search for places
-                data = search_places(search_query, next_page_token=page_token)
+                # Search for places; the next_page_token becomes valid
+                # PAGE_TOKEN_DELAY after it is issued
+                if next_page is None:
+                    data = await self._search_page_async(client, search_query, page_token,
+                                                         token_issued_at + PAGE_TOKEN_DELAY)
+                else:
+                    data = await next_page
+                    next_page = None
+                token_issued_at = time.monotonic()
+                scraped_at = datetime.now().isoformat()
                 places = data.get("results", [])
                 
                 if not places:
-                    logger.info(f"No more results found for {location}")
+                    logger.info("No more results found for %s", location)
                     break
                 
-                # Process each place with progress bar
-                desc = f"Processing {location} (Page {page_count})"
-                with tqdm(places, desc=desc, unit="place", leave=False) as pbar:
-                    for place in pbar:
-                        if (self.max_results_per_location and 
-                            len(location_results) >= self.max_results_per_location):
-                            logger.info(f"Reached max results limit for {location}: {self.max_results_per_location}")
-                            return location_results
-                        
-                        try:
-                            details = get_place_details(place["place_id"])
-                            validated_data = self.validate_place_data(details, location)
-                            
-                            if validated_data:
-                                location_results.append(validated_data)
-                                pbar.set_postfix({"Found": len(location_results)})
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing place {place.get('name', 'Unknown')}: {e}")
+                places = self._new_places(seen_place_ids, places)
+                # Fetch the next page in the background while this one is processed
+                page_token = data.get("next_page_token")
+                if self._prefetches_next_page(found, places, page_token):
+                    next_page = asyncio.ensure_future(self._search_page_async(
+                        client, search_query, page_token, token_issued_at + PAGE_TOKEN_DELAY))
+                
+                # Fetch details only for as many places as rows are still wanted,
+                # with another round only for places that get rejected
+                remaining = places
+                while remaining and found < max_results:
+                    batch_size = min(len(remaining), max_results - found)
+                    batch, remaining = remaining[:batch_size], remaining[batch_size:]
+                    if self.places_api == "new":
+                        # Text Search (New) results already carry every field we need
+                        details_list = batch
+                    else:
+                        details_list = await asyncio.gather(
+                            *(self._get_place_details_once_async(client, place["place_id"]) for place in batch),
+                            return_exceptions=True
+                        )
+                    
+                    for place, details in zip(batch, details_list):
+                        if isinstance(details, Exception):
+                            logger.error("Error processing place %s: %s", place.get("name", "Unknown"), details)
                             continue
+                        
+                        validated_data = validate(details, location, scraped_at)
+                        if validated_data and is_new_listing(seen_listings, validated_data):
+                            queue_row((location, validated_data))
+                            found += 1
                 
-                # Check for next page
-                page_token = data.get("next_page_token")
-                if page_token:
-                    logger.debug(f"Waiting {PAGE_TOKEN_DELAY}s before next page for {location}...")
-                    time.sleep(PAGE_TOKEN_DELAY)
-                else:
+                # Check for next page, without searching again once the cap is met
+                if found >= max_results:
+                    logger.info("Reached max results limit for %s: %s", location, max_results)
+                    break
+                if not page_token:
                     break
                     
         except GooglePlacesError as e:
-            logger.error(f"Google Places API error for {location}: {e}")
-            if not location_results:
+            logger.error("Google Places API error for %s: %s", location, e)
+            if not found:
                 raise
-        except KeyboardInterrupt:
-            logger.info(f"Search interrupted by user for {location}")
         except Exception as e:
-            logger.error(f"Unexpected error during search for {location}: {e}")
-            if not location_results:
+            logger.error("Unexpected error during search for %s: %s", location, e)
+            if not found:
                 raise
+        finally:
+            if next_page is not None:
+                next_page.cancel()
         
-        logger.info(f"Completed search for {location}. Found {len(location_results)} providers")
-        return location_results
+        logger.info("Completed search for %s. Found %s providers", location, found)
+        return found
     
-    def fetch_all_providers(self):
+    async def fetch_all_providers_async(self):
         """
-        Fetch healthcare providers for all locations
+        Fetch healthcare providers for all locations on a single event loop
         """
-        logger.info(f"Starting multi-location search for {self.specialty}")
-        logger.info(f"Locations: {', '.join(self.places)}")
-        
-        total_locations = len(self.places)
+        logger.info("Starting multi-location search for %s", self.specialty)
+        logger.info("Locations: %s", ", ".join(self.places))
         
-        # Main progress bar for locations
-        with tqdm(self.places, desc="Processing locations", unit="location") as location_pbar:
-            for i, location in enumerate(location_pbar):
-                location_pbar.set_description(f"Processing {location}")
+        self._start_progress()
+        self._row_queue = asyncio.Queue()
+        row_writer = asyncio.create_task(self._drain_row_queue(self._row_queue))
+        try:
+            async with google_places_async.create_client(self.async_concurrency) as client:
+                async def fetch_location(location):
+                    try:
+                        await self.fetch_providers_for_location_async(client, location)
+                    except Exception as e:
+                        logger.error("Failed to process %s: %s", location, e)
                 
-                try:
-                    # Fetch providers for this location
-                    location_results = self.fetch_providers_for_location(location)
-                    
-                    if location_results:
-                        self.results_by_location[location] = location_results
-                        self.all_results.extend(location_results)
-                        
-                        location_pbar.set_postfix({
-                            "This location": len(location_results),
-                            "Total found": len(self.all_results)
-                        })
-                    else:
-                        logger.warning(f"No results found for {location}")
-                    
-                    # Delay between locations to be respectful to the API
-                    if i < total_locations - 1:  # Don't delay after the last location
-                        time.sleep(DELAY_BETWEEN_LOCATIONS)
-                        
-                except Exception as e:
-                    logger.error(f"Failed to process {location}: {e}")
-                    continue
+                await asyncio.gather(*(fetch_location(location) for location in self.places))
+        finally:
+            # Let the writer flush everything already queued before closing files
+            self._row_queue.put_nowait(None)
+            await row_writer
+            self._row_queue = None
+            self._close_output_files()
+            self._stop_progress()
+        
+        return self._finish_search()
+    
+    def _finish_search(self):
+        """
+        Total the rows written and warn about locations without results
+        """
+        for location in self.places:
+            if not self.location_counts[location]:
+                logger.warning("No results found for %s", location)
+        
+        self.total_found = sum(self.location_counts.values())
+        logger.info("Multi-location search completed. Total providers found: %s", self.total_found)
+        return self.total_found
+    
+    def _output_filename(self, location):
+        """
+        Get the CSV file that results for a location are written to
+        """
+        if not self.separate_files:
+            return self.output_file
         
-        logger.info(f"Multi-location search completed. Total providers found: {len(self.all_results)}")
-        return self.all_results
+        # Create filename based on location and specialty
+        safe_location = location.lower().replace(" ", "_").replace(",", "")
+        safe_specialty = self.specialty.lower().replace(" ", "_")
+        return f"{safe_specialty}_{safe_location}.csv"
+    
+    def _start_progress(self):
+        """
+        Start the run-wide progress bar, advanced once per written row
+        """
+        self._pbar = tqdm(desc="Providers found", unit="place", mininterval=0.5, smoothing=0)
+    
+    def _stop_progress(self):
+        """
+        Close the run-wide progress bar
+        """
+        if self._pbar is not None:
+            self._pbar.close()
+            self._pbar = None
+    
+    def _write_row(self, location, row):
+        """
+        Append a validated row to its CSV file, opening the file on first use
+        """
+        self._write_rows(((location, row),))
+    
+    def _write_rows(self, rows):
+        """
+        Append (location, row) pairs to their CSV files under a single lock
+        """
+        with self._output_lock:
+            for location, row in rows:
+                filename = self._output_filename(location)
+                if filename not in self._output_files:
+                    f = open(filename, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
+                    writer = csv.writer(f)
+                    writer.writerow(self._fieldnames)
+                    self._output_files[filename] = (f, writer)
+                
+                self._output_files[filename][1].writerow(self._row_values(row))
+                self._rows_written[filename] = self._rows_written.get(filename, 0) + 1
+                
+                # Counts for print_summary, so rows need not be kept in memory
+                self.location_counts[location] += 1
+                for field in ("phone", "website", "rating"):
+                    if row[field] != "N/A":
+                        self.quality_counts[field] += 1
+            if self._pbar is not None:
+                self._pbar.update(len(rows))
+    
+    async def _drain_row_queue(self, queue):
+        """
+        Write rows queued by async fetchers until a None sentinel arrives
+
+        Disk writes run in a worker thread so they never block the event loop;
+        rows that pile up during a write are coalesced into the next batch.
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < ROW_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+            if batch:
+                await asyncio.to_thread(self._write_rows, batch)
+            if done:
+                return
+    
+    def _close_output_files(self):
+        """
+        Flush and close every CSV file opened while streaming results
+        """
+        with self._output_lock:
+            for f, _ in self._output_files.values():
+                f.close()
+            self._output_files.clear()
     
     def save_results(self):
         """
-        Save results to CSV file(s)
+        Finish writing the streamed CSV file(s)
         """
-        if not self.all_results:
+        if not self._rows_written:
             logger.warning("No results to save")
             return False
         
-        success = True
-        
         try:
-            if self.separate_files:
-                # Save separate file for each location
-                for location, results in self.results_by_location.items():
-                    if not results:
-                        continue
-                    
-                    # Create filename based on location and specialty
-                    safe_location = location.lower().replace(" ", "_").replace(",", "")
-                    safe_specialty = self.specialty.lower().replace(" ", "_")
-                    filename = f"{safe_specialty}_{safe_location}.csv"
-                    
-                    self._save_csv_file(results, filename)
-                    logger.info(f"✅ Saved {len(results)} results for {location} to '{filename}'")
-            else:
-                # Save all results to single file
-                self._save_csv_file(self.all_results, self.output_file)
-                logger.info(f"✅ Saved {len(self.all_results)} total results to '{self.output_file}'")
-            
+            self._close_output_files()
         except Exception as e:
-            logger.error(f"Failed to save results: {e}")
-            success = False
+            logger.error("Failed to save results: %s", e)
+            return False
         
-        return success
-    
-    def _save_csv_file(self, results, filename):
-        """
-        Helper method to save results to a specific CSV file
-        """
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            if results:
-                fieldnames = results[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(results)
+        for filename, count in self._rows_written.items():
+            logger.info("✅ Saved %s results to '%s'", count, filename)
+        return True
     
     def print_summary(self):
         """
         Print a comprehensive summary of the results
         """
-        if not self.all_results:
+        if not self.total_found:
             print("No results found.")
             return
         
         print(f"\n📊 Multi-Location Search Summary:")
         print(f"   • Specialty searched: {self.specialty}")
         print(f"   • Locations searched: {len(self.places)}")
-        print(f"   • Total providers found: {len(self.all_results)}")
+        print(f"   • Total providers found: {self.total_found}")
         
         # Summary by location
         print(f"\n📍 Results by Location:")
-        for location, results in self.results_by_location.items():
-            count = len(results) if results else 0
-            print(f"   • {location}: {count} providers")
+        for location in self.places:
+            if self.location_counts[location]:
+                print(f"   • {location}: {self.location_counts[location]} providers")
         
         # Data quality summary
-        phone_count = sum(1 for r in self.all_results if r.get('phone', 'N/A') != 'N/A')
-        website_count = sum(1 for r in self.all_results if r.get('website', 'N/A') != 'N/A')
-        rating_count = sum(1 for r in self.all_results if r.get('rating', 'N/A') != 'N/A')
-        
         print(f"\n📋 Data Quality:")
-        print(f"   • Providers with phone numbers: {phone_count}")
-        print(f"   • Providers with websites: {website_count}")
-        print(f"   • Providers with ratings: {rating_count}")
+        print(f"   • Providers with phone numbers: {self.quality_counts['phone']}")
+        print(f"   • Providers with websites: {self.quality_counts['website']}")
+        print(f"   • Providers with ratings: {self.quality_counts['rating']}")
         
         # File output info
         if self.separate_files:
@@ -315,6 +729,18 @@ Examples:
   
   # Limit results per location
   python main.py -s physiotherapists --max-per-location 20
+  
+  # Fetch up to 16 place details at a time per results page
+  python main.py -s dentists --concurrency 16
+  
+  # One request per results page via Places API (New)
+  python main.py -s dentists --places-api new
+  
+  # Search every location concurrently on an asyncio event loop
+  python main.py -s dentists --async
+  
+  # Fetch fresh details instead of reusing cached ones
+  python main.py -s dentists --no-cache
         """
     )
     
@@ -354,6 +780,41 @@ Examples:
         help="Don't include search location in the data"
     )
     
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Concurrent place details requests per results page, or requests in flight in total "
+             f"with --async (default: {DEFAULT_DETAIL_WORKERS}, or {ASYNC_MAX_CONCURRENCY} with --async)"
+    )
+    
+    parser.add_argument(
+        "--places-api",
+        choices=["legacy", "new"],
+        default=DEFAULT_PLACES_API,
+        help="Places API to use; 'new' fetches all fields in the search request itself "
+             f"and needs Places API (New) enabled for your key (default: '{DEFAULT_PLACES_API}')"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the on-disk place details cache"
+    )
+    
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=CACHE_TTL,
+        help=f"Seconds before cached place details are fetched again (default: {CACHE_TTL})"
+    )
+    
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run all locations on one asyncio event loop instead of worker threads"
+    )
+    
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -369,6 +830,13 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.cache_ttl < 0:
+        parser.error("--cache-ttl cannot be negative")
+    
+    configure_cache(enabled=not args.no_cache, ttl=args.cache_ttl)
+    
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
@@ -385,35 +853,41 @@ def main():
         print(f"Output File: {args.output}")
     if args.max_per_location:
         print(f"Max Results per Location: {args.max_per_location}")
+    print(f"Places API: {args.places_api}")
     print("=" * 60)
     
     try:
-        # Create finder instance
-        finder = MultiLocationHealthcareFinder(
+        # Create finder instance; leaving the block closes the CSV output
+        with MultiLocationHealthcareFinder(
             specialty=args.specialty,
             places=places,
             output_file=args.output,
             max_results_per_location=args.max_per_location,
             separate_files=args.separate_files,
-            include_location_in_data=not args.no_location_column
-        )
-        
-        # Fetch providers
-        results = finder.fetch_all_providers()
+            include_location_in_data=not args.no_location_column,
+            detail_workers=args.concurrency or DEFAULT_DETAIL_WORKERS,
+            places_api=args.places_api,
+            async_concurrency=args.concurrency or ASYNC_MAX_CONCURRENCY
+        ) as finder:
+            # Fetch providers, streaming them to CSV as they are found
+            if args.use_async:
+                total_found = asyncio.run(finder.fetch_all_providers_async())
+            else:
+                total_found = finder.fetch_all_providers()
         
-        if results:
-            # Save results
-            if finder.save_results():
-                finder.print_summary()
+            if total_found:
+                # Save results
+                if finder.save_results():
+                    finder.print_summary()
+                else:
+                    logger.error("Failed to save results")
+                    sys.exit(1)
             else:
-                logger.error("Failed to save results")
+                print("❌ No results found across all locations. Try different search terms.")
                 sys.exit(1)
-        else:
-            print("❌ No results found across all locations. Try different search terms.")
-            sys.exit(1)
             
     except GooglePlacesError as e:
-        logger.error(f"Google Places API error: {e}")
+        logger.error("Google Places API error: %s", e)
         print("\n💡 Tips:")
         print("   • Check your API key in the .env file")
         print("   • Ensure Places API is enabled in Google Cloud Console")
@@ -425,8 +899,12 @@ def main():
         sys.exit(0)
         
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
+    finally:
+        close_session()
+        close_cache()
+
 if __name__ == "__main__":
     main()